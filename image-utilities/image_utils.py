@@ -3,10 +3,24 @@
 
 import customtkinter as ctk
 from tkinter import filedialog
-from PIL import Image, ImageTk
+from PIL import Image, ImageTk, features
+import io
 import os
 
 
+def warn_if_slow_jpeg():
+    """Warn when Pillow lacks the SIMD-accelerated libjpeg-turbo backend."""
+    try:
+        has_turbo = features.check_feature("libjpeg_turbo")
+    except Exception:
+        has_turbo = None
+    if has_turbo is False:
+        print(
+            "Warning: Pillow is not linked against libjpeg-turbo; "
+            "JPEG encoding will be slower. Consider installing pillow-simd."
+        )
+
+
 class ImageCompressorApp(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -20,6 +34,10 @@ class ImageCompressorApp(ctk.CTk):
         self.compressed_image = None
         self.original_size = 0
         self.compressed_size = 0
+        self._pending_compress = None
+        self._preview_src = None
+        self._encode_src = None
+        self.display_size = (400, 400)
 
         # Create main layout
         self.grid_columnconfigure(0, weight=1)
@@ -106,11 +124,23 @@ class ImageCompressorApp(ctk.CTk):
             self.original_size = os.path.getsize(file_path)
 
             # Resize image for display
-            display_size = (400, 400)
             display_image = self.resize_image_aspect_ratio(
-                self.original_image, display_size
+                self.original_image, self.display_size
             )
 
+            # Convert to a JPEG-compatible mode once at load time instead of
+            # on every slider tick, leaving the original untouched
+            if self.original_image.mode in ("RGBA", "LA", "P"):
+                self._encode_src = self.original_image.convert("RGB")
+            else:
+                self._encode_src = self.original_image
+
+            # The preview is shown at 400x400, so slider events only need
+            # to encode a capped-resolution copy; JPEG encode cost scales
+            # with pixel count. Full resolution is kept for save_image.
+            self._preview_src = self._encode_src.copy()
+            self._preview_src.thumbnail((800, 800), Image.Resampling.LANCZOS)
+
             # Use CTkImage instead of ImageTk.PhotoImage
             photo = ctk.CTkImage(
                 light_image=display_image,
@@ -125,24 +155,40 @@ class ImageCompressorApp(ctk.CTk):
             self.save_button.configure(state="normal")
 
     def update_quality(self, value):
+        if self.original_image:
+            self.quality_label.configure(text=f"Compression Quality: {int(value)}%")
+
+            # Debounce: dragging the slider fires many events per second,
+            # so only the last position within the window recompresses
+            if self._pending_compress is not None:
+                self.after_cancel(self._pending_compress)
+            self._pending_compress = self.after(
+                120, lambda: self._do_compress(value)
+            )
+
+    def _do_compress(self, value):
+        self._pending_compress = None
         if self.original_image:
             quality = int(value)
-            self.quality_label.configure(text=f"Compression Quality: {quality}%")
 
-            # Create compressed version
-            temp_path = "temp_compressed.jpg"
-            if self.original_image.mode == "RGBA":
-                self.original_image = self.original_image.convert(
-                    "RGB"
-                )  # Convert to RGB
-            self.original_image.save(temp_path, "JPEG", quality=quality)
-            self.compressed_size = os.path.getsize(temp_path)
+            # Create compressed version in memory; no disk round-trip per
+            # slider event
+            buffer = io.BytesIO()
+            self._preview_src.save(buffer, "JPEG", quality=quality)
+
+            # The preview encode is capped at 800x800, so its byte count
+            # undershoots the full-resolution output; JPEG size is roughly
+            # linear in pixel count at a fixed quality, so scale by the
+            # pixel ratio to estimate what save_image will produce
+            full_px = self._encode_src.width * self._encode_src.height
+            preview_px = self._preview_src.width * self._preview_src.height
+            self.compressed_size = buffer.tell() * full_px // preview_px
 
             # Load and display compressed preview
-            self.compressed_image = Image.open(temp_path)
-            display_size = (400, 400)
+            buffer.seek(0)
+            self.compressed_image = Image.open(buffer)
             display_image = self.resize_image_aspect_ratio(
-                self.compressed_image, display_size
+                self.compressed_image, self.display_size
             )
 
             # Use CTkImage instead of ImageTk.PhotoImage
@@ -161,12 +207,9 @@ class ImageCompressorApp(ctk.CTk):
                 (self.original_size - self.compressed_size) / self.original_size
             ) * 100
 
-            size_text = f"Original: {original_mb:.2f}MB | Compressed: {compressed_mb:.2f}MB | Reduction: {reduction:.1f}%"
+            size_text = f"Original: {original_mb:.2f}MB | Compressed: ~{compressed_mb:.2f}MB | Reduction: ~{reduction:.1f}%"
             self.size_label.configure(text=size_text)
 
-            # Clean up temp file
-            os.remove(temp_path)
-
     def save_image(self):
         if self.original_image:
             quality = int(self.quality_slider.get())
@@ -175,7 +218,7 @@ class ImageCompressorApp(ctk.CTk):
             )
 
             if file_path:
-                self.original_image.save(file_path, "JPEG", quality=quality)
+                self._encode_src.save(file_path, "JPEG", quality=quality)
 
     def resize_image_aspect_ratio(self, image, target_size):
         original_width, original_height = image.size
@@ -195,5 +238,6 @@ class ImageCompressorApp(ctk.CTk):
 
 
 if __name__ == "__main__":
+    warn_if_slow_jpeg()
     app = ImageCompressorApp()
     app.mainloop()
@@ -3,20 +3,53 @@
 # pip install psutil windows-curses
 
 import curses
+import heapq
+import os
 import psutil
+import threading
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
 import sys
 
 
+@dataclass
+class Snapshot:
+    """One consistent set of system metrics produced by the sampler thread."""
+    cpu_total: float = 0.0
+    cpu_per: list = field(default_factory=list)
+    memory: object = None
+    swap: object = None
+    disk: object = None
+    net: object = None
+    battery: object = None
+    temps: dict = field(default_factory=dict)
+    load: tuple = None
+    procs: list = field(default_factory=list)
+
+
+_UNITS = ("", "K", "M", "G", "T", "P")
+
+# Fixed templates for lines rebuilt every tick; %-formatting against a
+# hoisted template is cheaper than re-parsing an f-string per call
+_CPU_TOTAL_FMT = "Total: %5.1f%%"
+_CORE_FMT = "Core %2d: %5.1f%%"
+_PROC_FMT = "%-20s%-8d%6.1f%%%6.1f%%"
+
+# Box-drawing glyphs as module constants; draw_box touches several per
+# border row, so plain loads beat dict lookups by string key
+_BOX_TL, _BOX_TR, _BOX_BL, _BOX_BR = "╔", "╗", "╚", "╝"
+_BOX_H, _BOX_V = "═", "║"
+
+
 def get_size(bytes):
     """
     Convert bytes to human readable format
     """
-    for unit in ["", "K", "M", "G", "T", "P"]:
-        if bytes < 1024:
-            return f"{bytes:.2f}{unit}B"
-        bytes /= 1024
+    # Pick the unit from the bit length instead of a divide loop: this is
+    # called many times per redraw, so keep it O(1)
+    i = 0 if bytes < 1024 else min(5, (int(bytes).bit_length() - 1) // 10)
+    return f"{bytes / (1 << (10 * i)):.2f}{_UNITS[i]}B"
 
 
 class SystemMonitor:
@@ -24,55 +57,350 @@ class SystemMonitor:
         self.stdscr = stdscr
         self.init_colors()
         curses.curs_set(0)  # Hide cursor
-        self.stdscr.nodelay(1)  # Make getch() non-blocking
+        # getch() blocks up to one refresh interval and returns -1 on
+        # timeout; this paces the loop and makes 'q' respond immediately
+        self.stdscr.timeout(1000)
+        # keypad(True) turns SIGWINCH into a KEY_RESIZE keypress, so the
+        # main loop only re-measures the terminal when it actually changed
+        self.stdscr.keypad(True)
         self.min_height = 12
         self.min_width = 40
-        # Add box drawing constants
-        self.box_chars = {
-            'tl': '╔', 'tr': '╗', 'bl': '╚', 'br': '╝',
-            'h': '═', 'v': '║',
-            'ttee': '╤', 'btee': '╧', 'ltee': '╟', 'rtee': '╢'
-        }
+        self.max_processes = 5  # Rows shown in the Top Processes pane
+        # Terminal dimensions, refreshed once per frame rather than on
+        # every safe_addstr call
+        self._dims = self.stdscr.getmaxyx()
+        # Shadow of what was last drawn, keyed by (y, x): writes that match
+        # the previous frame are skipped entirely
+        self._shadow = {}
+        # Static chrome (boxes/titles) is drawn once, then only after the
+        # screen is cleared or a conditional pane (dis)appears
+        self._chrome_dirty = True
+        self._chrome_caps = None
+        # Horizontal border runs, prebuilt once per box width
+        self._h_lines = {}
+        # Bar interiors keyed by (filled, width); only a handful of
+        # widths and fill levels exist, so each string is built once
+        self._bar_strs = {}
+        # Formatted sizes for values that never change at runtime
+        # (memory/swap/disk totals), keyed by the raw byte count
+        self._total_strs = {}
+        # Process objects kept across ticks; re-instantiating every process
+        # each second is the dominant psutil cost
+        self._proc_cache = {}
+        # State for the direct /proc reader used on Linux: previous
+        # per-process jiffies and the previous whole-system jiffy count
+        self._procfs_times = {}
+        self._procfs_total = 0
+        self._page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        # (timestamp, value) cache for psutil calls that change slowly or
+        # never; see _cached()
+        self._metric_cache = {}
+        # Snapshots are produced on a background thread and swapped in
+        # whole, so the UI thread never blocks on psutil and never sees a
+        # half-updated frame
+        self._snapshot_lock = threading.Lock()
+        # Battery/temperature support is fixed for the process lifetime:
+        # probe once here instead of hasattr-checking on every sample,
+        # and keep the sensor functions bound for the sampler's hot path
+        self._battery_fn = getattr(psutil, "sensors_battery", None)
+        self._temps_fn = getattr(psutil, "sensors_temperatures", None)
+        try:
+            self._has_battery = (
+                self._battery_fn is not None and self._battery_fn() is not None
+            )
+        except Exception:
+            self._has_battery = False
+        try:
+            self._has_temps = self._temps_fn is not None and bool(self._temps_fn())
+        except Exception:
+            self._has_temps = False
+        # Prime cpu_percent: the first call always returns 0.0
+        psutil.cpu_percent(interval=None, percpu=True)
+        self._snapshot = self._build_snapshot()
+        sampler = threading.Thread(target=self._sample_loop, daemon=True)
+        sampler.start()
+
+    def _cached(self, key, ttl, fn):
+        """Call fn at most once per ttl seconds; ttl=None caches forever."""
+        entry = self._metric_cache.get(key)
+        now = time.monotonic()
+        if entry is not None and (ttl is None or now - entry[0] < ttl):
+            return entry[1]
+        value = fn()
+        self._metric_cache[key] = (now, value)
+        return value
+
+    # Seconds between re-reads, per metric. CPU and memory move fast and
+    # follow the 1s sampler tick; network and the process table every
+    # couple of seconds is plenty; disk usage, temperatures and battery
+    # drift over tens of seconds.
+    NET_PERIOD = 2
+    PROC_PERIOD = 2
+    TEMP_PERIOD = 5
+    DISK_PERIOD = 10
+    BATTERY_PERIOD = 30
+
+    def _build_snapshot(self):
+        """Collect one full set of metrics from psutil.
+
+        Each metric is re-queried on its own cadence via _cached(); a
+        snapshot still always carries a full value set, just with the
+        slow-moving entries reused between refreshes.
+        """
+        battery = None
+        if self._has_battery:
+            battery = self._cached("battery", self.BATTERY_PERIOD, self._battery_fn)
+        temps = {}
+        if self._has_temps:
+            temps = self._cached("temps", self.TEMP_PERIOD, self._temps_fn)
+        try:
+            load = psutil.getloadavg()
+        except AttributeError:
+            load = None
+
+        # One percpu read covers both displays: calling cpu_percent()
+        # twice would walk /proc/stat twice and the second call would
+        # reset the timing state of the first
+        cpu_per = psutil.cpu_percent(interval=None, percpu=True)
+        cpu_total = sum(cpu_per) / len(cpu_per) if cpu_per else 0.0
+
+        return Snapshot(
+            cpu_total=cpu_total,
+            cpu_per=cpu_per,
+            memory=psutil.virtual_memory(),
+            swap=psutil.swap_memory(),
+            disk=self._cached(
+                "disk", self.DISK_PERIOD, lambda: psutil.disk_usage("/")
+            ),
+            net=self._cached("net", self.NET_PERIOD, psutil.net_io_counters),
+            battery=battery,
+            temps=temps,
+            load=load,
+            procs=self._cached("procs", self.PROC_PERIOD, self._sample_processes),
+        )
+
+    def _sample_loop(self, interval=1.0):
+        """Refresh the published snapshot once per interval.
+
+        A transient psutil failure (sensor reads in particular can raise)
+        must not kill the thread, which would silently freeze every
+        metric at the last snapshot; skip the bad sample and try again.
+        """
+        while True:
+            try:
+                snapshot = self._build_snapshot()
+            except Exception:
+                pass
+            else:
+                with self._snapshot_lock:
+                    self._snapshot = snapshot
+            time.sleep(interval)
+
+    def latest_snapshot(self):
+        with self._snapshot_lock:
+            return self._snapshot
+
+    def _sample_processes(self):
+        """Sample per-process CPU/memory for the Top Processes pane.
+
+        Backend order: direct procfs reads on Linux, cached psutil
+        elsewhere. A BPF task-iterator backend would be faster still but
+        needs CAP_BPF, bcc and a recent kernel; see the README.
+        """
+        if sys.platform == "linux":
+            try:
+                return self._sample_processes_procfs()
+            except OSError:
+                pass
+        return self._sample_processes_psutil()
+
+    def _sample_processes_procfs(self):
+        """Read /proc directly, bypassing psutil's Process machinery.
+
+        One read of /proc/<pid>/stat per process yields comm, utime, stime
+        and rss; CPU percent comes from the jiffy delta against the
+        previous sample, scaled the same way psutil scales it.
+        """
+        with open("/proc/stat", "rb") as f:
+            total = sum(int(x) for x in f.readline().split()[1:])
+        dtotal = total - self._procfs_total if self._procfs_total else 0
+        self._procfs_total = total
+
+        mem_total = self._cached(
+            "mem_total", None, lambda: psutil.virtual_memory().total
+        )
+        ncpu = self._cached("ncpu", None, psutil.cpu_count) or 1
+        prev_times = self._procfs_times
+        new_times = {}
+        procs = []
+        for entry in os.scandir("/proc"):
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            try:
+                with open(f"/proc/{entry.name}/stat", "rb") as f:
+                    data = f.read()
+            except OSError:
+                continue  # Process exited mid-scan
+            # comm may itself contain spaces or parens, so split around
+            # the last closing paren
+            rparen = data.rfind(b")")
+            comm = data[data.find(b"(") + 1:rparen].decode("utf-8", "replace")
+            fields = data[rparen + 2:].split()
+            jiffies = int(fields[11]) + int(fields[12])  # utime + stime
+            rss = int(fields[21]) * self._page_size
+            new_times[pid] = jiffies
+            prev = prev_times.get(pid)
+            if prev is None or dtotal <= 0:
+                cpu = 0.0
+            else:
+                cpu = (jiffies - prev) / dtotal * ncpu * 100.0
+            procs.append(
+                {
+                    "pid": pid,
+                    "name": comm,
+                    "cpu_percent": cpu,
+                    "memory_percent": rss / mem_total * 100.0,
+                }
+            )
+        self._procfs_times = new_times
+        return self._top_procs(procs)
+
+    def _sample_processes_psutil(self):
+        """Sample per-process CPU/memory using cached Process objects.
+
+        Only the delta of new PIDs is instantiated each tick; cached
+        instances keep their cpu_percent timing state, so no priming pass
+        over the whole process table is repeated.
+        """
+        cache = self._proc_cache
+        current = psutil.pids()
+        procs = []
+        for pid in current:
+            entry = cache.get(pid)
+            if entry is None:
+                try:
+                    proc = psutil.Process(pid)
+                    # First cpu_percent call always returns 0.0; prime it
+                    # and report the process from the next tick on. The
+                    # name is fixed for a PID's lifetime, so read it once
+                    # here rather than on every tick
+                    proc.cpu_percent(None)
+                    cache[pid] = (proc, proc.name())
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+                continue
+            proc, name = entry
+            try:
+                # oneshot() coalesces the /proc reads backing cpu and
+                # memory into one pass per process
+                with proc.oneshot():
+                    procs.append(
+                        {
+                            "pid": pid,
+                            "name": name,
+                            "cpu_percent": proc.cpu_percent(None),
+                            "memory_percent": proc.memory_percent(),
+                        }
+                    )
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                del cache[pid]
+
+        # Drop PIDs that have exited
+        for pid in set(cache).difference(current):
+            del cache[pid]
+
+        return self._top_procs(procs)
+
+    def _top_procs(self, procs):
+        # Only the top few are displayed: nlargest is O(n log k) instead
+        # of sorting the whole process table. Idle (zero-CPU) processes
+        # are dropped from the candidate set first unless too few remain.
+        busy = [p for p in procs if p["cpu_percent"]]
+        if len(busy) < self.max_processes:
+            busy = procs
+        return heapq.nlargest(
+            self.max_processes, busy, key=lambda x: x["cpu_percent"] or 0.0
+        )
 
     def init_colors(self):
         curses.start_color()
-        curses.init_pair(1, curses.COLOR_GREEN, curses.COLOR_BLACK)
-        curses.init_pair(2, curses.COLOR_RED, curses.COLOR_BLACK)
-        curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-        curses.init_pair(4, curses.COLOR_BLUE, curses.COLOR_BLACK)
-        curses.init_pair(5, curses.COLOR_MAGENTA, curses.COLOR_BLACK)
+        # -1 keeps the terminal's own background instead of painting black
+        curses.use_default_colors()
+        curses.init_pair(1, curses.COLOR_GREEN, -1)
+        curses.init_pair(2, curses.COLOR_RED, -1)
+        curses.init_pair(3, curses.COLOR_YELLOW, -1)
+        curses.init_pair(4, curses.COLOR_BLUE, -1)
+        curses.init_pair(5, curses.COLOR_MAGENTA, -1)
+        # Attribute ints resolved once; hot-path addstrs use these rather
+        # than calling color_pair on every write
+        self.ATTR_GREEN = curses.color_pair(1)
+        self.ATTR_RED = curses.color_pair(2)
+        self.ATTR_YELLOW = curses.color_pair(3)
 
     def safe_addstr(self, y, x, text, attr=curses.A_NORMAL):
-        """Safely add a string to the screen, checking boundaries"""
-        height, width = self.stdscr.getmaxyx()
-        if y < height and x < width:
-            # Truncate the text if it would exceed the screen width
-            max_length = width - x
-            if len(text) > max_length:
-                text = text[:max_length]
-            try:
-                self.stdscr.addstr(y, x, text, attr)
-            except curses.error:
-                pass  # Ignore errors from writing to bottom-right corner
+        """Safely add a string to the screen, checking boundaries.
+
+        Keeps a shadow of what was last drawn at each position and skips
+        the write when nothing changed, so steady-state frames cost almost
+        no curses calls. The screen is no longer erased between frames, so
+        shorter strings are padded over the previous ones.
+        """
+        height, width = self._dims
+        if y >= height or x >= width:
+            return
+        # Truncate the text if it would exceed the screen width
+        max_length = width - x
+        if len(text) > max_length:
+            text = text[:max_length]
+        prev = self._shadow.get((y, x))
+        if prev is not None:
+            if len(prev[0]) > len(text):
+                text = text.ljust(min(len(prev[0]), max_length))
+            if prev == (text, attr):
+                return
+        try:
+            self.stdscr.addstr(y, x, text, attr)
+        except curses.error:
+            pass  # Ignore errors from writing to bottom-right corner
+        self._shadow[(y, x)] = (text, attr)
+
+    def safe_addstr_block(self, y, x, lines, attr=curses.A_NORMAL):
+        """Write consecutive lines starting at (y, x)."""
+        addstr = self.safe_addstr
+        for i, line in enumerate(lines):
+            addstr(y + i, x, line, attr)
+
+    def _total_str(self, n):
+        """get_size for run-time constants, formatted once and cached."""
+        s = self._total_strs.get(n)
+        if s is None:
+            s = self._total_strs[n] = get_size(n)
+        return s
 
     def draw_box(self, y, x, height, width, title=""):
         """Draw a box with optional title"""
         # Draw corners
-        self.safe_addstr(y, x, self.box_chars['tl'])
-        self.safe_addstr(y, x + width - 1, self.box_chars['tr'])
-        self.safe_addstr(y + height - 1, x, self.box_chars['bl'])
-        self.safe_addstr(y + height - 1, x + width - 1, self.box_chars['br'])
-        
-        # Draw horizontal lines
-        for i in range(1, width - 1):
-            self.safe_addstr(y, x + i, self.box_chars['h'])
-            self.safe_addstr(y + height - 1, x + i, self.box_chars['h'])
-        
-        # Draw vertical lines
+        self.safe_addstr(y, x, _BOX_TL)
+        self.safe_addstr(y, x + width - 1, _BOX_TR)
+        self.safe_addstr(y + height - 1, x, _BOX_BL)
+        self.safe_addstr(y + height - 1, x + width - 1, _BOX_BR)
+
+        # Draw each horizontal edge with one call instead of one per cell.
+        # The double-line glyphs are multi-byte, so addstr with a prebuilt
+        # run replaces curses' chtype-only hline here. Runs are cached per
+        # width so they are not rebuilt every frame.
+        h_line = self._h_lines.get(width)
+        if h_line is None:
+            h_line = self._h_lines[width] = _BOX_H * (width - 2)
+        self.safe_addstr(y, x + 1, h_line)
+        self.safe_addstr(y + height - 1, x + 1, h_line)
+
+        # Draw vertical lines, one call per row
         for i in range(1, height - 1):
-            self.safe_addstr(y + i, x, self.box_chars['v'])
-            self.safe_addstr(y + i, x + width - 1, self.box_chars['v'])
-        
+            self.safe_addstr(y + i, x, _BOX_V)
+            self.safe_addstr(y + i, x + width - 1, _BOX_V)
+
         # Draw title if provided
         if title:
             self.safe_addstr(y, x + 2, f" {title} ")
@@ -81,165 +409,189 @@ class SystemMonitor:
         """Draw a progress bar with percentage"""
         filled = int((width - 2) * percentage / 100)
         self.safe_addstr(y, x, "[")
-        
+        self.safe_addstr(y, x + width - 1, "]")
+
         # Choose color based on percentage
         if percentage >= 80:
-            color = 2  # Red for high usage
+            attr = self.ATTR_RED
         elif percentage >= 60:
-            color = 3  # Yellow for medium usage
+            attr = self.ATTR_YELLOW
         else:
-            color = 1  # Green for low usage
-            
-        self.safe_addstr(y, x + 1, "█" * filled, curses.color_pair(color))
-        self.safe_addstr(y, x + 1 + filled, " " * (width - 2 - filled))
-        self.safe_addstr(y, x + width - 1, "]")
+            attr = self.ATTR_GREEN
+
+        # The whole interior is one write at a fixed position (the padding
+        # spaces render identically under the color attr), so the shadow
+        # buffer skips the bar entirely when neither the fill length nor
+        # the color level changed since the last frame — the common case
+        # for a system in steady state
+        bar = self._bar_strs.get((filled, width))
+        if bar is None:
+            bar = self._bar_strs[(filled, width)] = ("█" * filled).ljust(width - 2)
+        self.safe_addstr(y, x + 1, bar, attr)
+
+    def _draw_chrome(self):
+        """Draw the static boxes, titles and headers.
+
+        Called on the first frame and again only after the screen has been
+        cleared (too-small terminal, resize) or a conditional pane appears
+        or disappears; borders never change otherwise.
+        """
+        self.draw_box(0, 0, 3, 76, "System Monitor")
+        self.draw_box(3, 0, 4, 35, "System Info")
+        self.draw_box(7, 0, 7, 35, "CPU Usage")
+        self.draw_box(7, 40, 7, 35, "Memory Usage")
+        self.draw_box(14, 0, 6, 35, "Disk Usage")
+        self.draw_box(14, 40, 6, 35, "Network I/O")
+        if self._frame.battery:
+            self.draw_box(20, 0, 5, 35, "Battery Status")
+        if self._frame.temps:
+            self.draw_box(20, 40, 6, 35, "Temperature Sensors")
+        self.draw_box(25, 0, 8, 76, "Top Processes")
+        self.safe_addstr(26, 2, "Name".ljust(20) + "PID".ljust(8) +
+                         "CPU%".rjust(7) + "MEM%".rjust(7), curses.A_BOLD)
 
     def draw_header(self, y, x):
-        """Updated header with double-line box"""
-        width = 76  # Total width of the interface
-        self.draw_box(y, x, 3, width, "System Monitor")
+        """Updated header; the box itself is part of the static chrome"""
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.safe_addstr(y + 1, x + 2, f"Press 'q' to quit | {now}", curses.A_DIM)
 
     def draw_cpu_info(self, y, x):
         """Updated CPU information display"""
-        self.draw_box(y, x, 7, 35, "CPU Usage")
-        cpu_percent = psutil.cpu_percent()
-        self.safe_addstr(y + 1, x + 2, f"Total: {cpu_percent:>5.1f}%")
+        cpu_percent = self._frame.cpu_total
+        self.safe_addstr(y + 1, x + 2, _CPU_TOTAL_FMT % cpu_percent)
         self.draw_progress_bar(y + 2, x + 2, 30, cpu_percent)
-        
-        cpu_percents = psutil.cpu_percent(percpu=True)
-        for i, percent in enumerate(cpu_percents[:3]):  # Show first 3 cores
-            self.safe_addstr(y + 3 + i, x + 2, f"Core {i:>2}: {percent:>5.1f}%")
-            self.draw_progress_bar(y + 3 + i, x + 11, 21, percent)
+
+        # The bar starts past the 15-char label: the shadow buffer keys
+        # cells by exact position, so writes on a row must never overlap
+        for i, percent in enumerate(self._frame.cpu_per[:3]):  # Show first 3 cores
+            self.safe_addstr(y + 3 + i, x + 2, _CORE_FMT % (i, percent))
+            self.draw_progress_bar(y + 3 + i, x + 17, 15, percent)
 
     def draw_memory_info(self, y, x):
         """Updated memory information display"""
-        self.draw_box(y, x, 7, 35, "Memory Usage")
-        memory = psutil.virtual_memory()
-        swap = psutil.swap_memory()
-        
-        self.safe_addstr(y + 1, x + 2, f"RAM: {get_size(memory.used)}/{get_size(memory.total)}")
+        memory = self._frame.memory
+        swap = self._frame.swap
+
+        self.safe_addstr(y + 1, x + 2, f"RAM: {get_size(memory.used)}/{self._total_str(memory.total)}")
         self.draw_progress_bar(y + 2, x + 2, 30, memory.percent)
         
-        self.safe_addstr(y + 4, x + 2, f"Swap: {get_size(swap.used)}/{get_size(swap.total)}")
+        self.safe_addstr(y + 4, x + 2, f"Swap: {get_size(swap.used)}/{self._total_str(swap.total)}")
         self.draw_progress_bar(y + 5, x + 2, 30, swap.percent)
 
     def draw_disk_info(self, y, x):
         """Updated disk information display"""
-        self.draw_box(y, x, 6, 35, "Disk Usage")
-        disk = psutil.disk_usage("/")
-        
-        self.safe_addstr(y + 1, x + 2, f"Total: {get_size(disk.total)}")
+        disk = self._frame.disk
+
+        self.safe_addstr(y + 1, x + 2, f"Total: {self._total_str(disk.total)}")
         self.safe_addstr(y + 2, x + 2, f"Used: {get_size(disk.used)}")
         self.draw_progress_bar(y + 3, x + 2, 30, disk.percent)
         self.safe_addstr(y + 4, x + 2, f"Free: {get_size(disk.free)}")
 
     def draw_network_info(self, y, x):
         """Updated network information display"""
-        self.draw_box(y, x, 6, 35, "Network I/O")
-        net_io = psutil.net_io_counters()
-        
-        # Calculate speeds (simplified version)
-        self.safe_addstr(y + 1, x + 2, f"↑ {get_size(net_io.bytes_sent)}")
-        self.safe_addstr(y + 2, x + 2, f"↓ {get_size(net_io.bytes_recv)}")
-        
-        # Add packet information
-        self.safe_addstr(y + 3, x + 2, f"Packets sent: {net_io.packets_sent}")
-        self.safe_addstr(y + 4, x + 2, f"Packets recv: {net_io.packets_recv}")
+        net_io = self._frame.net
+
+        self.safe_addstr_block(y + 1, x + 2, (
+            f"↑ {get_size(net_io.bytes_sent)}",
+            f"↓ {get_size(net_io.bytes_recv)}",
+            f"Packets sent: {net_io.packets_sent}",
+            f"Packets recv: {net_io.packets_recv}",
+        ))
 
     def draw_processes(self, y, x):
         """Updated process information display"""
-        self.draw_box(y, x, 8, 76, "Top Processes")
-        processes = []
-        for proc in psutil.process_iter(["pid", "name", "cpu_percent", "memory_percent"]):
-            try:
-                processes.append(proc.info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-
-        processes.sort(key=lambda x: x["cpu_percent"], reverse=True)
-        
-        # Header
-        self.safe_addstr(y + 1, x + 2, "Name".ljust(20) + "PID".ljust(8) + 
-                        "CPU%".rjust(7) + "MEM%".rjust(7), curses.A_BOLD)
-        
-        # Process list
-        for i, proc in enumerate(processes[:5]):
-            name = proc['name'][:19].ljust(20)
-            pid = str(proc['pid']).ljust(8)
-            cpu = f"{proc['cpu_percent']:>6.1f}%"
-            mem = f"{proc['memory_percent']:>6.1f}%"
-            
-            color = curses.color_pair(1)  # Default green
-            if proc['cpu_percent'] > 50:
-                color = curses.color_pair(2)  # Red for high CPU
-            elif proc['cpu_percent'] > 20:
-                color = curses.color_pair(3)  # Yellow for medium CPU
-                
-            self.safe_addstr(y + i + 2, x + 2, 
-                           f"{name}{pid}{cpu}{mem}", color)
+        processes = self._frame.procs
+
+        # Process list; blank rows left over from larger previous lists
+        shown = processes[: self.max_processes]
+        for i in range(len(shown), self.max_processes):
+            self.safe_addstr(y + i + 2, x + 2, "")
+        for i, proc in enumerate(shown):
+            cpu_percent = proc['cpu_percent']
+            color = self.ATTR_GREEN  # Default green
+            if cpu_percent > 50:
+                color = self.ATTR_RED  # Red for high CPU
+            elif cpu_percent > 20:
+                color = self.ATTR_YELLOW  # Yellow for medium CPU
+
+            line = _PROC_FMT % (
+                proc['name'][:19], proc['pid'], cpu_percent,
+                proc['memory_percent'],
+            )
+            self.safe_addstr(y + i + 2, x + 2, line, color)
 
     def draw_battery_info(self, y, x):
         """Updated battery information display"""
-        if hasattr(psutil, "sensors_battery"):
-            battery = psutil.sensors_battery()
-            if battery:
-                self.draw_box(y, x, 5, 35, "Battery Status")
-                self.safe_addstr(y + 1, x + 2, 
-                    f"Charge: {battery.percent:>3}%")
-                self.draw_progress_bar(y + 2, x + 2, 30, battery.percent)
-                
-                status = "Plugged In" if battery.power_plugged else "On Battery"
-                if not battery.power_plugged and battery.secsleft != -1:
-                    hours = battery.secsleft // 3600
-                    minutes = (battery.secsleft % 3600) // 60
-                    status = f"{status} ({hours}h {minutes}m left)"
-                self.safe_addstr(y + 3, x + 2, status)
+        battery = self._frame.battery
+        if battery:
+            self.safe_addstr(y + 1, x + 2,
+                f"Charge: {battery.percent:>3}%")
+            self.draw_progress_bar(y + 2, x + 2, 30, battery.percent)
+
+            status = "Plugged In" if battery.power_plugged else "On Battery"
+            if not battery.power_plugged and battery.secsleft != -1:
+                hours = battery.secsleft // 3600
+                minutes = (battery.secsleft % 3600) // 60
+                status = f"{status} ({hours}h {minutes}m left)"
+            self.safe_addstr(y + 3, x + 2, status)
+        else:
+            # A transiently failed read must not leave the previous
+            # readings on screen; blank the pane's rows
+            for row in range(1, 4):
+                self.safe_addstr(y + row, x + 2, "")
 
     def draw_temperature_info(self, y, x):
         """Updated temperature information display"""
-        if hasattr(psutil, "sensors_temperatures"):
-            temps = psutil.sensors_temperatures()
-            if temps:
-                self.draw_box(y, x, 6, 35, "Temperature Sensors")
-                row = 1
-                for name, entries in temps.items():
-                    for entry in entries:
-                        if row > 4: break
-                        temp = entry.current
-                        color = curses.color_pair(1)  # Green for normal
-                        if temp > 80:
-                            color = curses.color_pair(2)  # Red for hot
-                        elif temp > 60:
-                            color = curses.color_pair(3)  # Yellow for warm
-                            
-                        self.safe_addstr(y + row, x + 2, 
-                            f"{name[:12]}: {temp:>5.1f}°C", color)
-                        row += 1
+        temps = self._frame.temps
+        row = 1
+        if temps:
+            for name, entries in temps.items():
+                for entry in entries:
+                    if row > 4: break
+                    temp = entry.current
+                    color = self.ATTR_GREEN  # Green for normal
+                    if temp > 80:
+                        color = self.ATTR_RED  # Red for hot
+                    elif temp > 60:
+                        color = self.ATTR_YELLOW  # Yellow for warm
+
+                    self.safe_addstr(y + row, x + 2,
+                        f"{name[:12]}: {temp:>5.1f}°C", color)
+                    row += 1
+        # Blank any rows a previous frame used but this one does not —
+        # also when a sample comes back empty, so readings never linger
+        while row <= 4:
+            self.safe_addstr(y + row, x + 2, "")
+            row += 1
 
     def draw_system_info(self, y, x):
         """Draw system uptime and load"""
-        self.draw_box(y, x, 4, 35, "System Info")
-        boot_time = datetime.fromtimestamp(psutil.boot_time())
+        # Boot time is immutable: one syscall for the program's lifetime
+        boot_time = datetime.fromtimestamp(
+            self._cached("boot_time", None, psutil.boot_time)
+        )
         uptime = datetime.now() - boot_time
         days = uptime.days
         hours = uptime.seconds // 3600
         minutes = (uptime.seconds % 3600) // 60
 
         self.safe_addstr(y + 1, x + 2, f"Uptime: {days}d {hours}h {minutes}m")
-        
-        try:
-            load1, load5, load15 = psutil.getloadavg()
+
+        if self._frame.load is not None:
+            load1, load5, load15 = self._frame.load
             self.safe_addstr(y + 2, x + 2, f"Load: {load1:.1f}, {load5:.1f}, {load15:.1f}")
-        except AttributeError:
-            pass
 
     def check_terminal_size(self):
-        """Check if terminal meets minimum size requirements"""
-        height, width = self.stdscr.getmaxyx()
+        """Re-measure the terminal; called at startup and on KEY_RESIZE.
+
+        Either way the previous frame is invalid, so the screen and the
+        shadow buffer are cleared together and the chrome is redrawn.
+        """
+        height, width = self._dims = self.stdscr.getmaxyx()
+        self.stdscr.clear()
+        self._shadow.clear()
+        self._chrome_dirty = True
         if height < self.min_height or width < self.min_width:
-            self.stdscr.clear()
             message = (
                 f"Terminal too small. Min size: {self.min_width}x{self.min_height}"
             )
@@ -253,12 +605,33 @@ class SystemMonitor:
 
     def run(self):
         try:
+            # The terminal size only changes on KEY_RESIZE, so it is
+            # measured once here and again only when that key arrives
+            size_ok = self.check_terminal_size()
             while True:
-                if not self.check_terminal_size():
-                    time.sleep(1)
+                if not size_ok:
+                    c = self.stdscr.getch()
+                    if c == ord("q"):
+                        break
+                    if c == curses.KEY_RESIZE:
+                        size_ok = self.check_terminal_size()
                     continue
 
-                self.stdscr.clear()
+                # The screen is not erased between frames: safe_addstr
+                # diffs against its shadow buffer and only rewrites cells
+                # whose content changed since the previous frame
+
+                # One snapshot per frame so every pane shows the same tick
+                self._frame = self.latest_snapshot()
+
+                # Redraw chrome when a conditional pane appears/disappears
+                caps = (bool(self._frame.battery), bool(self._frame.temps))
+                if caps != self._chrome_caps:
+                    self._chrome_caps = caps
+                    self._chrome_dirty = True
+                if self._chrome_dirty:
+                    self._draw_chrome()
+                    self._chrome_dirty = False
 
                 # Updated layout positioning
                 self.draw_header(0, 0)
@@ -267,18 +640,21 @@ class SystemMonitor:
                 self.draw_memory_info(7, 40)
                 self.draw_disk_info(14, 0)
                 self.draw_network_info(14, 40)
-                self.draw_battery_info(20, 0)
-                self.draw_temperature_info(20, 40)
+                if self._has_battery:
+                    self.draw_battery_info(20, 0)
+                if self._has_temps:
+                    self.draw_temperature_info(20, 40)
                 self.draw_processes(25, 0)
 
-                self.stdscr.refresh()
+                self.stdscr.noutrefresh()
+                curses.doupdate()
 
-                # Check for quit
+                # Check for quit; the timeout also paces the refresh rate
                 c = self.stdscr.getch()
                 if c == ord("q"):
                     break
-
-                time.sleep(1)  # Update every second
+                if c == curses.KEY_RESIZE:
+                    size_ok = self.check_terminal_size()
 
         except KeyboardInterrupt:
             pass
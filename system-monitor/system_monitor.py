@@ -11,31 +11,80 @@ import customtkinter as ctk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import threading
-from collections import deque
+import queue
 import numpy as np
 
+# Bytes -> megabytes as one vectorized multiply over a history buffer
+_INV_MB = np.float32(1.0 / 1048576.0)
+
+# Log block separator, built once
+_SEP = "=" * 50
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# Static host facts, queried once at import: core counts never change,
+# and platform.processor() can shell out on some systems
+_CPU_COUNT = psutil.cpu_count()
+_CPU_COUNT_LOGICAL = psutil.cpu_count(logical=True)
+_SYS_INFO = {
+    "system": platform.system(),
+    "release": platform.release(),
+    "version": platform.version(),
+    "machine": platform.machine(),
+    "processor": platform.processor(),
+    "hostname": platform.node(),
+}
+
 
 class SystemMonitor:
     def __init__(self, log_to_file=False):
-        self.cpu_count = psutil.cpu_count()
-        self.cpu_count_logical = psutil.cpu_count(logical=True)
+        self.cpu_count = _CPU_COUNT
+        self.cpu_count_logical = _CPU_COUNT_LOGICAL
         self.log_to_file = log_to_file  # New attribute for logging option
         self.running = False
         self.data_points = 60  # Store 60 seconds of data
-        self.cpu_history = deque([0] * self.data_points, maxlen=self.data_points)
-        self.memory_history = deque([0] * self.data_points, maxlen=self.data_points)
-        self.network_recv_history = deque(
-            [0] * self.data_points, maxlen=self.data_points
-        )
-        self.network_send_history = deque(
-            [0] * self.data_points, maxlen=self.data_points
+        # Preallocated ring buffers sharing one write cursor: appending a
+        # sample is a single array store, and readers get the buffers
+        # oldest-first through history() without per-element Python work
+        self.cpu_history = np.zeros(self.data_points, np.float32)
+        # Per-core percentages as one (ticks, cores) matrix: each sample
+        # lands in a contiguous row, so the average is a single pass over
+        # adjacent floats and history per core is a column slice away
+        self.cpu_core_history = np.zeros(
+            (self.data_points, self.cpu_count_logical or 1), np.float32
         )
+        self.memory_history = np.zeros(self.data_points, np.float32)
+        self.network_recv_history = np.zeros(self.data_points, np.float32)
+        self.network_send_history = np.zeros(self.data_points, np.float32)
+        self._cursor = 0
         self.last_network_recv = 0
         self.last_network_send = 0
+        # Samples queue up here for the log writer thread, so the
+        # sampling loop never blocks on stdout or the log file
+        self._log_queue = queue.Queue(maxsize=256)
+        # The partition table effectively never changes while the monitor
+        # runs; enumerate it once instead of on every disk sample
+        self._partitions = psutil.disk_partitions()
+        # Disk usage moves on the order of seconds, and statvfs per mount
+        # per tick adds up (and can stall on network mounts); refresh it
+        # every few ticks and reuse the cached result in between
+        self._disk_every = 10
+        self._disk_info_cache = {}
+        self._tick = 0
+        # Warm up cpu_percent: the first non-blocking call returns 0.0,
+        # so prime it here and let the monitor loop's sleep set the
+        # measurement window from then on
+        psutil.cpu_percent(interval=None, percpu=True)
+
+    def history(self, buffer):
+        """Return a ring buffer ordered oldest-first."""
+        return np.roll(buffer, -self._cursor)
 
     def get_cpu_info(self):
         """Get CPU usage information."""
-        cpu_percent = psutil.cpu_percent(interval=1, percpu=True)
+        # Non-blocking: reports usage since the previous call instead of
+        # sleeping a second inside psutil on top of the loop's own sleep
+        cpu_percent = psutil.cpu_percent(interval=None, percpu=True)
         cpu_freq = psutil.cpu_freq()
         return {
             "cpu_percent": cpu_percent,
@@ -63,10 +112,9 @@ class SystemMonitor:
 
     def get_disk_info(self):
         """Get disk usage information."""
-        partitions = psutil.disk_partitions()
         disk_info = {}
 
-        for partition in partitions:
+        for partition in self._partitions:
             try:
                 usage = psutil.disk_usage(partition.mountpoint)
                 disk_info[partition.mountpoint] = {
@@ -97,21 +145,96 @@ class SystemMonitor:
 
     def format_bytes(self, bytes):
         """Convert bytes to human readable format."""
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if bytes < 1024:
-                return f"{bytes:.2f} {unit}"
-            bytes /= 1024
+        # Pick the unit from the bit length instead of a divide loop;
+        # this also keeps >=1 PB values from falling off the end
+        if bytes <= 0:
+            return "0.00 B"
+        i = min((int(bytes).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+        return f"{bytes / (1 << (10 * i)):.2f} {_BYTE_UNITS[i]}"
 
     def stop_monitoring(self):
         self.running = False
 
+    def _format_sample(self, sample):
+        """Render one sample to the text block logged per tick."""
+        cpu_info = sample["cpu"]
+        memory_info = sample["memory"]
+        disk_info = sample["disk"]
+        network_info = sample["network"]
+
+        # Collect fragments and join once: += on a growing string copies
+        # the whole buffer on every append
+        parts = [f"\n{_SEP}\n"]
+        parts.append(
+            f"System Monitor - {sample['time'].strftime('%Y-%m-%d %H:%M:%S')}\n"
+        )
+        parts.append(_SEP + "\n")
+
+        # CPU Information
+        parts.append("\nCPU Information:\n")
+        parts.append(f"Physical cores: {cpu_info['cpu_count']}\n")
+        parts.append(f"Logical cores: {cpu_info['cpu_count_logical']}\n")
+        parts.append("\n".join(
+            f"Core {i}: {p}%" for i, p in enumerate(cpu_info["cpu_percent"])
+        ) + "\n")
+
+        # Memory Information
+        parts.append("\nMemory Information:\n")
+        parts.append(f"Total: {self.format_bytes(memory_info['total'])}\n")
+        parts.append(f"Available: {self.format_bytes(memory_info['available'])}\n")
+        parts.append(f"Used: {self.format_bytes(memory_info['used'])} ({memory_info['percent']}%)\n")
+        parts.append(f"Swap Used: {self.format_bytes(memory_info['swap']['used'])} ({memory_info['swap']['percent']}%)\n")
+
+        # Disk Information
+        parts.append("\nDisk Information:\n")
+        for mount_point, usage in disk_info.items():
+            parts.append(f"\nMount Point: {mount_point}\n")
+            parts.append(f"Total: {self.format_bytes(usage['total'])}\n")
+            parts.append(f"Used: {self.format_bytes(usage['used'])} ({usage['percent']}%)\n")
+            parts.append(f"Free: {self.format_bytes(usage['free'])}\n")
+
+        # Network Information
+        parts.append("\nNetwork Information:\n")
+        parts.append(f"Bytes Sent: {self.format_bytes(network_info['bytes_sent'])}\n")
+        parts.append(f"Bytes Received: {self.format_bytes(network_info['bytes_recv'])}\n")
+        parts.append(f"Packets Sent: {network_info['packets_sent']}\n")
+        parts.append(f"Packets Received: {network_info['packets_recv']}\n")
+        return "".join(parts)
+
+    def _log_writer(self):
+        """Drain queued samples and do all formatting and I/O off the
+        sampling thread, flushing each batch with a single write."""
+        log_file = open("log.txt", "a") if self.log_to_file else None
+        try:
+            while self.running or not self._log_queue.empty():
+                try:
+                    sample = self._log_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                batch = [self._format_sample(sample)]
+                # Whatever queued up while we were writing goes out in
+                # the same flush
+                while True:
+                    try:
+                        batch.append(
+                            self._format_sample(self._log_queue.get_nowait())
+                        )
+                    except queue.Empty:
+                        break
+                text = "".join(batch)
+                print(text)
+                if log_file:
+                    log_file.write(text)
+        finally:
+            if log_file:
+                log_file.close()
+
     def monitor(self, interval=1, update_callback=None):
         """Monitor system resources continuously."""
         self.running = True
         try:
-            log_file = None
-            if self.log_to_file:
-                log_file = open("log.txt", "a")
+            writer = threading.Thread(target=self._log_writer, daemon=True)
+            writer.start()
 
             while self.running:
                 # Get system info
@@ -119,10 +242,14 @@ class SystemMonitor:
                 memory_info = self.get_memory_info()
                 network_info = self.get_network_info()
 
-                # Update histories
-                cpu_avg = sum(cpu_info["cpu_percent"]) / len(cpu_info["cpu_percent"])
-                self.cpu_history.append(cpu_avg)
-                self.memory_history.append(memory_info["percent"])
+                # Update histories; writing the per-core list into its
+                # preallocated row converts and stores in one pass, and
+                # the mean is a SIMD reduction over that row rather than
+                # a second walk of boxed floats
+                cursor = self._cursor
+                row = self.cpu_core_history[cursor]
+                row[:] = cpu_info["cpu_percent"]
+                cpu_avg = float(row.mean())
 
                 # Calculate network speed
                 network_recv_speed = (
@@ -131,66 +258,41 @@ class SystemMonitor:
                 network_send_speed = (
                     network_info["bytes_sent"] - self.last_network_send
                 ) / interval
-                self.network_recv_history.append(network_recv_speed)
-                self.network_send_history.append(network_send_speed)
                 self.last_network_recv = network_info["bytes_recv"]
                 self.last_network_send = network_info["bytes_sent"]
 
-                # Generate log output
-                log_output = "\n" + "=" * 50 + "\n"
-                log_output += (
-                    f"System Monitor - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-                )
-                log_output += "=" * 50 + "\n"
-
-                # CPU Information
-                log_output += "\nCPU Information:\n"
-                log_output += f"Physical cores: {cpu_info['cpu_count']}\n"
-                log_output += f"Logical cores: {cpu_info['cpu_count_logical']}\n"
-                for i, percentage in enumerate(cpu_info["cpu_percent"]):
-                    log_output += f"Core {i}: {percentage}%\n"
-
-                # Memory Information
-                log_output += "\nMemory Information:\n"
-                log_output += f"Total: {self.format_bytes(memory_info['total'])}\n"
-                log_output += (
-                    f"Available: {self.format_bytes(memory_info['available'])}\n"
-                )
-                log_output += f"Used: {self.format_bytes(memory_info['used'])} ({memory_info['percent']}%)\n"
-                log_output += f"Swap Used: {self.format_bytes(memory_info['swap']['used'])} ({memory_info['swap']['percent']}%)\n"
-
-                # Disk Information
-                disk_info = self.get_disk_info()
-                log_output += "\nDisk Information:\n"
-                for mount_point, usage in disk_info.items():
-                    log_output += f"\nMount Point: {mount_point}\n"
-                    log_output += f"Total: {self.format_bytes(usage['total'])}\n"
-                    log_output += f"Used: {self.format_bytes(usage['used'])} ({usage['percent']}%)\n"
-                    log_output += f"Free: {self.format_bytes(usage['free'])}\n"
-
-                # Network Information
-                log_output += "\nNetwork Information:\n"
-                log_output += (
-                    f"Bytes Sent: {self.format_bytes(network_info['bytes_sent'])}\n"
-                )
-                log_output += (
-                    f"Bytes Received: {self.format_bytes(network_info['bytes_recv'])}\n"
-                )
-                log_output += f"Packets Sent: {network_info['packets_sent']}\n"
-                log_output += f"Packets Received: {network_info['packets_recv']}\n"
-
-                if self.log_to_file:
-                    log_file.write(log_output)
-                print(log_output)
+                self.cpu_history[cursor] = cpu_avg
+                self.memory_history[cursor] = memory_info["percent"]
+                self.network_recv_history[cursor] = network_recv_speed
+                self.network_send_history[cursor] = network_send_speed
+                self._cursor = (cursor + 1) % self.data_points
+
+                # Disk usage is refreshed on a longer schedule than the
+                # fast-moving metrics
+                if self._tick % self._disk_every == 0:
+                    self._disk_info_cache = self.get_disk_info()
+                self._tick += 1
+
+                # Hand the raw readings to the writer thread; formatting
+                # and I/O happen there so this loop's cadence stays free
+                # of stdout/file stalls
+                sample = {
+                    "time": datetime.now(),
+                    "cpu": cpu_info,
+                    "memory": memory_info,
+                    "disk": self._disk_info_cache,
+                    "network": network_info,
+                }
+                try:
+                    self._log_queue.put_nowait(sample)
+                except queue.Full:
+                    pass  # Drop the log entry rather than stall sampling
 
                 if update_callback:
                     update_callback()
 
                 time.sleep(interval)
 
-            if log_file:
-                log_file.close()
-
         except Exception as e:
             print(f"Error: {e}")
             self.running = False
@@ -204,17 +306,19 @@ class MonitoringApp:
 
         self.monitor = SystemMonitor()
         self.monitoring_thread = None
-        self.interface_frames = []
-
-        # Get system info once at startup
-        self.system_info = {
-            "system": platform.system(),
-            "release": platform.release(),
-            "version": platform.version(),
-            "machine": platform.machine(),
-            "processor": platform.processor(),
-            "hostname": platform.node()
-        }
+        # Widget pool keyed by interface name: refreshing reconfigures
+        # label text in place instead of rebuilding every frame
+        self.interface_widgets = {}
+        self._iface_error_label = None
+        self._update_pending = False
+        # Minimum seconds between renders; anything arriving faster than
+        # the UI can usefully display is coalesced away
+        self._min_draw_interval = 0.25
+        self._last_draw = 0.0
+        self._last_iface_update = 0.0
+
+        # Static host facts are gathered once at import
+        self.system_info = _SYS_INFO
 
         self.setup_ui()
 
@@ -278,188 +382,287 @@ class MonitoringApp:
         self.setup_graphs()
 
     def setup_graphs(self):
-        self.figure, (self.ax1, self.ax2, self.ax3) = plt.subplots(
-            3, 1, figsize=(8, 6), height_ratios=[1, 1, 1]
-        )
-        self.figure.subplots_adjust(hspace=0.4)
+        # One Axes with three stacked bands instead of three subplots:
+        # every axes carries its own spines, ticks and title artists, so
+        # a single banded axes makes full redraws (resize, background
+        # recapture) several times cheaper
+        self.figure, self.ax = plt.subplots(figsize=(8, 6))
         self.figure.set_facecolor("#2b2b2b")
 
-        # Common graph settings
-        for ax in [self.ax1, self.ax2, self.ax3]:
-            ax.set_facecolor("#2b2b2b")
-            ax.tick_params(colors="white", labelsize=8)
-            ax.grid(True, color="gray", alpha=0.3, linestyle='--')
-            ax.spines['bottom'].set_color('white')
-            ax.spines['top'].set_color('white')
-            ax.spines['left'].set_color('white')
-            ax.spines['right'].set_color('white')
-
-        # CPU Usage
-        self.ax1.set_title("CPU Usage %", color="white", pad=10, fontsize=10)
-        self.ax1.set_ylim(0, 100)
-        self.ax1.set_xlabel("Time (s)", color="white", fontsize=8)
-
-        # Memory Usage
-        self.ax2.set_title("Memory Usage %", color="white", pad=10, fontsize=10)
-        self.ax2.set_ylim(0, 100)
-        self.ax2.set_xlabel("Time (s)", color="white", fontsize=8)
-
-        # Network Usage
-        self.ax3.set_title("Network Usage (MB/s)", color="white", pad=10, fontsize=10)
-        self.ax3.set_xlabel("Time (s)", color="white", fontsize=8)
+        ax = self.ax
+        ax.set_facecolor("#2b2b2b")
+        ax.tick_params(colors="white", labelsize=8)
+        ax.grid(True, color="gray", alpha=0.3, linestyle='--')
+        ax.spines['bottom'].set_color('white')
+        ax.spines['top'].set_color('white')
+        ax.spines['left'].set_color('white')
+        ax.spines['right'].set_color('white')
+        ax.set_xlabel("Time (s)", color="white", fontsize=8)
+
+        # Bands: CPU % in [0, 100], memory % in [100, 200], network
+        # (normalized to its autoscaled top) in [200, 300]
+        ax.set_ylim(0, 300)
+        ax.set_xlim(0, self.monitor.data_points - 1)
+        ax.set_yticks([0, 50, 100, 150, 200, 250, 300])
+        ax.set_yticklabels(["0", "50", "100", "50", "100", "50", "100"])
+        ax.axhline(100, color="white", linewidth=0.8, alpha=0.5)
+        ax.axhline(200, color="white", linewidth=0.8, alpha=0.5)
+        band_font = {"color": "white", "fontsize": 9, "va": "top"}
+        ax.text(1, 97, "CPU Usage %", **band_font)
+        ax.text(1, 197, "Memory Usage %", **band_font)
+        ax.text(1, 297, "Network Usage (MB/s)", **band_font)
+
+        # The network band rescales by transforming the data, not the
+        # axis, so growing its range never invalidates the background
+        self._net_top = 1.0
+        self.net_scale_text = ax.text(
+            self.monitor.data_points - 2, 297, f"top: {self._net_top:.1f} MB/s",
+            color="gray", fontsize=8, va="top", ha="right", animated=True,
+        )
+
+        # Persistent line artists, created once and updated in place each
+        # tick; animated=True keeps full draws from painting them so the
+        # captured background stays line-free
+        time_points = range(self.monitor.data_points)
+        zeros = [0] * self.monitor.data_points
+        (self.cpu_line,) = ax.plot(
+            time_points, zeros, color="#00ff00", linewidth=2, animated=True
+        )
+        (self.mem_line,) = ax.plot(
+            time_points, zeros, color="#00ffff", linewidth=2, animated=True
+        )
+        (self.recv_line,) = ax.plot(
+            time_points, zeros, color="#00ff00", label="Download", linewidth=2,
+            animated=True,
+        )
+        (self.send_line,) = ax.plot(
+            time_points, zeros, color="#ff0000", label="Upload", linewidth=2,
+            animated=True,
+        )
+        ax.legend(loc='center right', facecolor="#2b2b2b", labelcolor="white")
 
         self.canvas = FigureCanvasTkAgg(self.figure, self.graphs_frame)
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
+        # Blitting state: the static part of the axes (background, grid,
+        # ticks, labels) is rasterized once and restored per tick, so an
+        # update only re-strokes the four polylines instead of the whole
+        # figure. The background is recaptured after any full redraw.
+        self._background = None
+        self.canvas.mpl_connect("resize_event", self._invalidate_background)
+
+    def _invalidate_background(self, event=None):
+        self._background = None
+
+    def _capture_background(self):
+        self.canvas.draw()
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def _schedule_update(self):
+        """Marshal a graph update from the monitor thread to the Tk loop.
+
+        Tk and matplotlib are main-thread only, so the monitor thread
+        must not touch the canvas directly. after(0, ...) hands the work
+        to the main loop; the pending flag collapses back-to-back
+        requests into a single redraw when the sampler outpaces the UI.
+        """
+        if self._update_pending:
+            return
+        self._update_pending = True
+        self.app.after(0, self._run_update)
+
+    def _run_update(self):
+        self._update_pending = False
+        self.update_graphs()
+
     def update_graphs(self):
         if not self.monitor.running:
             return
 
-        time_points = list(range(len(self.monitor.cpu_history)))
-
-        self.ax1.clear()
-        self.ax2.clear()
-        self.ax3.clear()
-
-        # Update CPU graph with enhanced visuals
-        self.ax1.plot(time_points, list(self.monitor.cpu_history), color="#00ff00", linewidth=2)
-        self.ax1.fill_between(time_points, list(self.monitor.cpu_history), alpha=0.2, color="#00ff00")
-        self.ax1.set_title("CPU Usage %", color="white", pad=10, fontsize=10)
-        self.ax1.set_ylim(0, 100)
-        self.ax1.grid(True, color="gray", alpha=0.3, linestyle='--')
-        self.ax1.tick_params(colors="white")
-
-        # Update Memory graph with enhanced visuals
-        self.ax2.plot(time_points, list(self.monitor.memory_history), color="#00ff00", linewidth=2)
-        self.ax2.fill_between(time_points, list(self.monitor.memory_history), alpha=0.2, color="#00ff00")
-        self.ax2.set_title("Memory Usage %", color="white", pad=10, fontsize=10)
-        self.ax2.set_ylim(0, 100)
-        self.ax2.grid(True, color="gray", alpha=0.3, linestyle='--')
-        self.ax2.tick_params(colors="white")
-
-        # Update Network graph with enhanced visuals
-        recv_mb = [x / 1024 / 1024 for x in self.monitor.network_recv_history]
-        send_mb = [x / 1024 / 1024 for x in self.monitor.network_send_history]
-        
-        self.ax3.plot(time_points, recv_mb, color="#00ff00", label="Download", linewidth=2)
-        self.ax3.plot(time_points, send_mb, color="#ff0000", label="Upload", linewidth=2)
-        self.ax3.fill_between(time_points, recv_mb, alpha=0.2, color="#00ff00")
-        self.ax3.fill_between(time_points, send_mb, alpha=0.2, color="#ff0000")
-        self.ax3.set_title("Network Usage (MB/s)", color="white", pad=10, fontsize=10)
-        self.ax3.grid(True, color="gray", alpha=0.3, linestyle='--')
-        self.ax3.tick_params(colors="white")
-        self.ax3.legend(loc='upper right', facecolor="#2b2b2b", labelcolor="white")
-
-        # Apply common settings to all axes
-        for ax in [self.ax1, self.ax2, self.ax3]:
-            ax.set_facecolor("#2b2b2b")
-            ax.tick_params(colors="white", labelsize=8)
-            ax.set_xlabel("Time (s)", color="white", fontsize=8)
-            ax.spines['bottom'].set_color('white')
-            ax.spines['top'].set_color('white')
-            ax.spines['left'].set_color('white')
-            ax.spines['right'].set_color('white')
+        # Drop updates arriving faster than the render floor so a fast
+        # sampler or repeated triggers cannot queue an update storm
+        now = time.monotonic()
+        if now - self._last_draw < self._min_draw_interval:
+            return
+        self._last_draw = now
+
+        monitor = self.monitor
+        recv_mb = monitor.history(monitor.network_recv_history) * _INV_MB
+        send_mb = monitor.history(monitor.network_send_history) * _INV_MB
+
+        # Grow the network scale only when a sample would clip, with 20%
+        # headroom so a slowly rising rate does not rescale every tick.
+        # The band renormalizes the data rather than moving axis limits,
+        # so the cached background stays valid across rescales.
+        ymax = max(float(recv_mb.max()), float(send_mb.max()), 1e-6)
+        if ymax > self._net_top:
+            self._net_top = ymax * 1.2
+            self.net_scale_text.set_text(f"top: {self._net_top:.1f} MB/s")
+
+        if self._background is None:
+            self._capture_background()
+
+        net_scale = 100.0 / self._net_top
+        self.cpu_line.set_ydata(monitor.history(monitor.cpu_history))
+        self.mem_line.set_ydata(monitor.history(monitor.memory_history) + 100.0)
+        self.recv_line.set_ydata(recv_mb * net_scale + 200.0)
+        self.send_line.set_ydata(send_mb * net_scale + 200.0)
+
+        # Restore the cached static background, stroke only the lines and
+        # the scale readout on top and push just that region to the
+        # screen; no ticks, grids or labels are re-rendered per tick
+        canvas = self.canvas
+        canvas.restore_region(self._background)
+        ax = self.ax
+        ax.draw_artist(self.cpu_line)
+        ax.draw_artist(self.mem_line)
+        ax.draw_artist(self.recv_line)
+        ax.draw_artist(self.send_line)
+        ax.draw_artist(self.net_scale_text)
+        canvas.blit(ax.bbox)
+
+    def _build_interface_frame(self, interface):
+        """Create the widget set for one interface and pool it by name."""
+        frame = ctk.CTkFrame(self.interfaces_frame)
+        frame.pack(fill="x", padx=5, pady=5)
+
+        # Interface name and status header with larger font
+        header_frame = ctk.CTkFrame(frame)
+        header_frame.pack(fill="x", padx=5, pady=2)
+
+        name_label = ctk.CTkLabel(
+            header_frame,
+            text=f"{interface}",
+            font=("Arial", 16, "bold"),  # Increased font size
+        )
+        name_label.pack(side="left", padx=5)
 
-        self.canvas.draw()
+        status_label = ctk.CTkLabel(
+            header_frame,
+            text="",
+            font=("Arial", 14),  # Increased font size
+        )
+        status_label.pack(side="right", padx=5)
+
+        # Speed indicator with larger font
+        speed_label = ctk.CTkLabel(
+            frame,
+            text="",
+            font=("Arial", 14),  # Increased font size
+        )
+        speed_label.pack(anchor="w", padx=5)
+
+        widgets = {
+            "frame": frame,
+            "status": status_label,
+            "speed": speed_label,
+            "io": None,
+        }
+        self.interface_widgets[interface] = widgets
+        return widgets
+
+    def _build_io_labels(self, widgets):
+        """Add the two-column traffic statistics labels to a frame."""
+        stats_frame = ctk.CTkFrame(widgets["frame"])
+        stats_frame.pack(fill="x", padx=5, pady=2)
+
+        # Left column - Received
+        recv_frame = ctk.CTkFrame(stats_frame)
+        recv_frame.pack(side="left", fill="x", expand=True, padx=2)
+        ctk.CTkLabel(recv_frame, text="Received", font=("Arial", 12, "bold")).pack()
+
+        # Right column - Sent
+        sent_frame = ctk.CTkFrame(stats_frame)
+        sent_frame.pack(side="right", fill="x", expand=True, padx=2)
+        ctk.CTkLabel(sent_frame, text="Sent", font=("Arial", 12, "bold")).pack()
+
+        io_labels = {}
+        for key, parent in (("recv", recv_frame), ("sent", sent_frame)):
+            for field in ("bytes", "packets", "errors", "drops"):
+                label = ctk.CTkLabel(parent, text="")
+                label.pack()
+                io_labels[f"{key}_{field}"] = label
+        widgets["io"] = io_labels
 
     def update_interfaces(self):
         """Update the network interfaces display"""
-        # Clear existing interface frames
-        for frame in self.interface_frames:
-            frame.destroy()
-        self.interface_frames.clear()
+        # Debounce rapid button clicks
+        now = time.monotonic()
+        if now - self._last_iface_update < self._min_draw_interval:
+            return
+        self._last_iface_update = now
 
         try:
             # Get stats for each network interface
             net_if_stats = psutil.net_if_stats()
             net_io_counters = psutil.net_io_counters(pernic=True)
 
+            # Destroy only frames whose interface disappeared
+            for interface in list(self.interface_widgets):
+                if interface not in net_if_stats:
+                    self.interface_widgets.pop(interface)["frame"].destroy()
+
             for interface, stats in net_if_stats.items():
-                # Create a frame for each interface
-                interface_frame = ctk.CTkFrame(self.interfaces_frame)
-                interface_frame.pack(fill="x", padx=5, pady=5)
-                self.interface_frames.append(interface_frame)
-
-                # Interface name and status header with larger font
-                header_frame = ctk.CTkFrame(interface_frame)
-                header_frame.pack(fill="x", padx=5, pady=2)
-
-                name_label = ctk.CTkLabel(
-                    header_frame,
-                    text=f"{interface}",
-                    font=("Arial", 16, "bold"),  # Increased font size
-                )
-                name_label.pack(side="left", padx=5)
+                widgets = self.interface_widgets.get(interface)
+                if widgets is None:
+                    widgets = self._build_interface_frame(interface)
 
                 status_color = "green" if stats.isup else "red"
-                status_label = ctk.CTkLabel(
-                    header_frame,
+                widgets["status"].configure(
                     text=f"{'●' if stats.isup else '○'} {'Up' if stats.isup else 'Down'}",
                     text_color=status_color,
-                    font=("Arial", 14),  # Increased font size
                 )
-                status_label.pack(side="right", padx=5)
-
-                # Speed indicator with larger font
-                speed_label = ctk.CTkLabel(
-                    interface_frame,
-                    text=f"Speed: {stats.speed if stats.speed else 'Unknown'} Mb/s",
-                    font=("Arial", 14),  # Increased font size
+                widgets["speed"].configure(
+                    text=f"Speed: {stats.speed if stats.speed else 'Unknown'} Mb/s"
                 )
-                speed_label.pack(anchor="w", padx=5)
 
                 if interface in net_io_counters:
                     io = net_io_counters[interface]
-
-                    # Traffic statistics in two columns
-                    stats_frame = ctk.CTkFrame(interface_frame)
-                    stats_frame.pack(fill="x", padx=5, pady=2)
-
-                    # Left column - Received
-                    recv_frame = ctk.CTkFrame(stats_frame)
-                    recv_frame.pack(side="left", fill="x", expand=True, padx=2)
-
-                    ctk.CTkLabel(
-                        recv_frame, text="Received", font=("Arial", 12, "bold")
-                    ).pack()
-                    ctk.CTkLabel(
-                        recv_frame, text=f"↓ {self.monitor.format_bytes(io.bytes_recv)}"
-                    ).pack()
-                    ctk.CTkLabel(
-                        recv_frame, text=f"Packets: {io.packets_recv:,}"
-                    ).pack()
-                    ctk.CTkLabel(recv_frame, text=f"Errors: {io.errin}").pack()
-                    ctk.CTkLabel(recv_frame, text=f"Drops: {io.dropin}").pack()
-
-                    # Right column - Sent
-                    sent_frame = ctk.CTkFrame(stats_frame)
-                    sent_frame.pack(side="right", fill="x", expand=True, padx=2)
-
-                    ctk.CTkLabel(
-                        sent_frame, text="Sent", font=("Arial", 12, "bold")
-                    ).pack()
-                    ctk.CTkLabel(
-                        sent_frame, text=f"↑ {self.monitor.format_bytes(io.bytes_sent)}"
-                    ).pack()
-                    ctk.CTkLabel(
-                        sent_frame, text=f"Packets: {io.packets_sent:,}"
-                    ).pack()
-                    ctk.CTkLabel(sent_frame, text=f"Errors: {io.errout}").pack()
-                    ctk.CTkLabel(sent_frame, text=f"Drops: {io.dropout}").pack()
+                    if widgets["io"] is None:
+                        self._build_io_labels(widgets)
+                    io_labels = widgets["io"]
+                    io_labels["recv_bytes"].configure(
+                        text=f"↓ {self.monitor.format_bytes(io.bytes_recv)}"
+                    )
+                    io_labels["recv_packets"].configure(
+                        text=f"Packets: {io.packets_recv:,}"
+                    )
+                    io_labels["recv_errors"].configure(text=f"Errors: {io.errin}")
+                    io_labels["recv_drops"].configure(text=f"Drops: {io.dropin}")
+                    io_labels["sent_bytes"].configure(
+                        text=f"↑ {self.monitor.format_bytes(io.bytes_sent)}"
+                    )
+                    io_labels["sent_packets"].configure(
+                        text=f"Packets: {io.packets_sent:,}"
+                    )
+                    io_labels["sent_errors"].configure(text=f"Errors: {io.errout}")
+                    io_labels["sent_drops"].configure(text=f"Drops: {io.dropout}")
 
         except Exception as e:
-            error_frame = ctk.CTkFrame(self.interfaces_frame)
-            error_frame.pack(fill="x", padx=5, pady=5)
-            self.interface_frames.append(error_frame)
-            ctk.CTkLabel(error_frame, text=f"Error getting interfaces: {str(e)}").pack()
+            if self._iface_error_label is None:
+                error_frame = ctk.CTkFrame(self.interfaces_frame)
+                error_frame.pack(fill="x", padx=5, pady=5)
+                self._iface_error_label = ctk.CTkLabel(error_frame, text="")
+                self._iface_error_label.pack()
+            self._iface_error_label.configure(
+                text=f"Error getting interfaces: {str(e)}"
+            )
 
     def toggle_monitoring(self):
         if not self.monitoring_thread or not self.monitoring_thread.is_alive():
-            # Start monitoring
-            self.monitor = SystemMonitor(self.log_var.get())
+            # Start monitoring; reuse the existing monitor instead of
+            # reconstructing it (and its buffers) on every toggle
+            monitor = self.monitor
+            monitor.log_to_file = self.log_var.get()
+            monitor.cpu_history.fill(0)
+            monitor.cpu_core_history.fill(0)
+            monitor.memory_history.fill(0)
+            monitor.network_recv_history.fill(0)
+            monitor.network_send_history.fill(0)
+            monitor._cursor = 0
             self.monitoring_thread = threading.Thread(
-                target=self.monitor.monitor,
-                kwargs={"update_callback": self.update_graphs},
+                target=monitor.monitor,
+                kwargs={"update_callback": self._schedule_update},
             )
             self.monitoring_thread.daemon = True
             self.monitoring_thread.start()